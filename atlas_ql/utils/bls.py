@@ -1,12 +1,57 @@
 from .paths import bls_path
+import hashlib
+import os
+import threading
 import pandas as pd 
 
 COLUMNS = ["gid", "pow", "snr", "wid", "per_day", "per_min", "q", "phi0", "dphi", "epo"]
 _catalog = None
+_catalog_lock = threading.Lock()
+
+# Concatenated catalog, cached alongside the .result files
+CATALOG_CACHE = "_catalog.feather"
+
+def _catalog_fingerprint(result_files):
+    # hashlib rather than hash(): str hashes are salted per process
+    h = hashlib.sha1()
+    for result_file in result_files:
+        stat = result_file.stat()
+        h.update(f"{result_file.name}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    return h.hexdigest()
+
+def _load_cached_catalog(fingerprint):
+    cache = bls_path(CATALOG_CACHE)
+    try:
+        if cache.with_suffix(".meta").read_text().strip() != fingerprint:
+            return None
+        df = pd.read_feather(cache)
+    except (ImportError, OSError, ValueError):
+        return None
+    return df.set_index('gid')
+
+def _save_cached_catalog(df, fingerprint):
+    # Best-effort: needs pyarrow and a writable BLS directory
+    cache = bls_path(CATALOG_CACHE)
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    try:
+        df.reset_index().to_feather(tmp)
+        os.replace(tmp, cache)
+        cache.with_suffix(".meta").write_text(fingerprint)
+    except (ImportError, OSError, ValueError):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
 
 def load_catalog():
     result_files = sorted(bls_path().glob("*.result"))
 
+    # Reuse the cached catalog unless a .result file was added or changed
+    fingerprint = _catalog_fingerprint(result_files)
+    df = _load_cached_catalog(fingerprint)
+    if df is not None:
+        return df
+
     dfs = []
     for result_file in result_files:
         df = pd.read_csv(result_file, names=COLUMNS)
@@ -25,12 +70,15 @@ def load_catalog():
     # Index by gid for fast lookups
     df.set_index('gid', inplace=True)
 
+    _save_cached_catalog(df, fingerprint)
     return df
 
 def get_catalog():
     global _catalog 
-    if _catalog is None:
-        _catalog = load_catalog()
+    # Locked so concurrent readers (e.g. plot_multi_lightcurves) load it once
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = load_catalog()
     return _catalog
 
 def get_bls_stats(source_id):
@@ -45,4 +93,50 @@ def get_period(source_id):
 
     if source_id in df.index:
         return df.loc[source_id, 'per_min']
-    return None
\ No newline at end of file
+    return None
+
+def refine_period(time, flux, flux_err, per_day, bands=None, df=None, oversample=10):
+    """
+    Refine a BLS period with a narrow Lomb-Scargle search around it.
+
+    The periodogram is evaluated with nifty-ls (an optional dependency),
+    which computes Lomb-Scargle as non-uniform FFTs. The search covers
+    1/per_day +/- df (in 1/day); df defaults to 5/baseline, i.e. five
+    peak widths either side. The grid spacing is 1/(oversample * baseline)
+    (at least 3 frequencies). The period of the highest peak is returned,
+    in days. The true peak must lie inside the window: if per_day is off
+    by more than df, the result sits at the window edge.
+
+    If bands (e.g. read_lightcurve's 'filter_code') is given, each band's
+    inverse-variance weighted mean is subtracted first, so zero-point
+    offsets between filters do not dilute the periodogram.
+    """
+    import numpy as np
+    import nifty_ls
+
+    time = np.asarray(time, dtype=float)
+    flux = np.asarray(flux, dtype=float)
+    flux_err = np.asarray(flux_err, dtype=float)
+
+    valid = (flux_err > 0) & np.isfinite(flux_err) & np.isfinite(flux) & np.isfinite(time)
+    order = np.argsort(time[valid])
+    t = time[valid][order]
+    y = flux[valid][order]
+    dy = flux_err[valid][order]
+
+    if bands is not None:
+        bands = np.asarray(bands)[valid][order]
+        y = y.copy()
+        for band in np.unique(bands):
+            in_band = bands == band
+            w = 1.0 / dy[in_band]**2
+            y[in_band] -= np.sum(w * y[in_band]) / np.sum(w)
+
+    f0 = 1.0 / per_day
+    baseline = t[-1] - t[0]
+    if df is None:
+        df = 5.0 / baseline
+    n_freq = max(int(np.ceil(2 * df * baseline * oversample)) + 1, 3)
+
+    result = nifty_ls.lombscargle(t, y, dy, fmin=f0 - df, fmax=f0 + df, Nf=n_freq)
+    return 1.0 / result.freq()[np.argmax(result.power)]
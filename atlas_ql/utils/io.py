@@ -1,74 +1,205 @@
-def read_lightcurve(source_id):
-    from .paths import lc_path
-    from .timeseries import bjd_convert
-    import pandas as pd 
+import functools
+
+COLUMNS = {
+    'mjd': 0, # start of exposure (all exposures are 30s)
+    'm': 1, 'dm': 2,
+    'ujy': 3, 'dujy': 4,
+    'filter': 5,
+    'err': 6, # tphot error flag
+    'chi_n': 7, # reduced chi^2 of PSF fit
+    'ra': 8, 'dec': 9, # RA and DEC at which the PSF is forced
+    'x': 10, 'y': 11, # x- and y-pixel value at which the PSF is forced
+    'maj': 12, 'min': 13, 'phi': 14,
+    'apfit': 15, # aperture correction (in mags) required by tphot
+    'mag5sig': 16, # five-sigma limit magnitude
+    'pa_deg': 17, # fitted position angle between North and detector Y-axis
+    'sky': 18, # sky mag in 1 sq arcsec
+    'obs': 19 # the ATLAS data file on which the measurements were made
+}
+
+# Columns actually used by read_lightcurve; the rest are never parsed
+USED_COLUMNS = ['mjd', 'ujy', 'dujy', 'filter', 'ra', 'dec']
+
+# ASCII codes of the ATLAS filters, as found in read_lightcurve's 'filter_code'
+FILTER_CODES = {'c': ord('c'), 'o': ord('o')}
+
+# Bump when the layout of read_lightcurve's output changes
+_CACHE_VERSION = 3
+
+def _freeze(value):
+    """Mark every array in a (nested) result dict read-only, for caching."""
+    if isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+    elif hasattr(value, 'flags'):
+        value.flags.writeable = False
+    return value
+
+def _copy_dicts(value):
+    # Fresh dicts around the shared read-only arrays of a cached result
+    if isinstance(value, dict):
+        return {key: _copy_dicts(item) for key, item in value.items()}
+    return value
+
+# numpy's C loadtxt (numpy >= 1.23, hence the requirement) measured faster
+# than both pyarrow and the pandas C engine on ATLAS-sized files
+def _read_columns(path):
+    """Parse the columns in USED_COLUMNS, or None if the file has no rows."""
+    import warnings
+    import numpy as np
+
+    dtype = np.dtype([(name, 'U1' if name == 'filter' else 'f8') for name in USED_COLUMNS])
+    usecols = [COLUMNS[name] for name in USED_COLUMNS]
+
+    with warnings.catch_warnings():
+        # Empty or comment-only files warn and parse to an empty array
+        warnings.simplefilter('ignore', UserWarning)
+        table = np.loadtxt(path, dtype=dtype, usecols=usecols, comments='#', ndmin=1)
+    if table.size == 0:
+        return None
+
+    columns = {name: np.ascontiguousarray(table[name]) for name in USED_COLUMNS}
+    # A U1 element is its character's code point
+    columns['filter_code'] = columns['filter'].view(np.uint32).astype(np.uint8)
+    return columns
+
+def _cache_path(path):
+    return path.with_name(path.name + '.npz')
+
+def _load_cached(path):
+    """Return the cached read_lightcurve output for path, or None if stale."""
+    import zipfile
+    import numpy as np
+
+    cache = _cache_path(path)
+    try:
+        if cache.stat().st_mtime_ns < path.stat().st_mtime_ns:
+            return None
+        with np.load(cache) as npz:
+            lc = {key: npz[key] for key in npz.files}
+    except (OSError, ValueError, zipfile.BadZipFile):
+        return None
+    if lc.pop('version', None) != _CACHE_VERSION:
+        return None
+
+    lc['ra'] = float(lc['ra'])
+    lc['dec'] = float(lc['dec'])
+    return lc
+
+def _save_cached(path, lc):
     import os
+    import threading
+    import numpy as np
+
+    cache = _cache_path(path)
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, 'wb') as f:
+            np.savez(f, version=_CACHE_VERSION, **lc)
+        os.replace(tmp, cache)
+    except OSError:
+        # Caching is best-effort; the data directory may be read-only
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
 
-    cols = {
-        'mjd': 0, # start of exposure (all exposures are 30s)
-        'm': 1, 'dm': 2,
-        'ujy': 3, 'dujy': 4,
-        'filter': 5,
-        'err': 6, # tphot error flag
-        'chi_n': 7, # reduced chi^2 of PSF fit
-        'ra': 8, 'dec': 9, # RA and DEC at which the PSF is forced
-        'x': 10, 'y': 11, # x- and y-pixel value at which the PSF is forced
-        'maj': 12, 'min': 13, 'phi': 14,
-        'apfit': 15, # aperture correction (in mags) required by tphot
-        'mag5sig': 16, # five-sigma limit magnitude
-        'pa_deg': 17, # fitted position angle between North and detector Y-axis
-        'sky': 18, # sky mag in 1 sq arcsec
-        'obs': 19 # the ATLAS data file on which the measurements were made
-    }
+def _parse_lightcurve(path):
+    """Parse path into read_lightcurve's output, with times not yet in BJD."""
+    import numpy as np
 
-    path = lc_path(source_id)
     try:
-        df = pd.read_csv(path, sep='\s+', header=None, comment='#')
-    except (FileNotFoundError, pd.errors.EmptyDataError):
+        columns = _read_columns(path)
+    except FileNotFoundError:
+        return None
+    if columns is None:
         return None
     
     # Get coordinates
-    ra = float(df.iloc[0, cols['ra']])
-    dec = float(df.iloc[0, cols['dec']])
+    ra = float(columns['ra'][0])
+    dec = float(columns['dec'][0])
     
     # Convert to mid-exposure time (MJD is start of 30s exposure, add 15s)
-    t_mjd = df.iloc[:, cols['mjd']].to_numpy(float)
+    t_mjd = columns['mjd']
     t_mid_mjd = t_mjd + 15.0 / 86400.0  # Add 15 seconds in days
     
-    # Convert to barycentric Julian date
-    t_bjd = bjd_convert(t_mid_mjd, ra, dec, date_format='mjd')
+    flux = columns['ujy']
+    flux_err = columns['dujy']
+    filter_col = columns['filter']
+    filter_code = columns['filter_code']
+
+    # Indices of each filter's points, computed once for all callers
+    c_idx = np.flatnonzero(filter_code == FILTER_CODES['c'])
+    o_idx = np.flatnonzero(filter_code == FILTER_CODES['o'])
+
+    return {"time": t_mid_mjd, "flux": flux, "flux_err": flux_err,
+            "filter": filter_col, "filter_code": filter_code,
+            "c_idx": c_idx, "o_idx": o_idx, "ra": ra, "dec": dec}
+
+class _Missing(Exception):
+    """Raised by the memoized readers so lru_cache never stores a miss."""
+
+@functools.lru_cache(maxsize=256)
+def _read_lightcurve_cached(source_id):
+    from .paths import lc_path
+    from .timeseries import bjd_convert
+
+    path = lc_path(source_id)
+
+    # Parsed, BJD-converted arrays are cached next to the source file
+    lc = _load_cached(path)
+    if lc is not None:
+        return _freeze(lc)
+
+    lc = _parse_lightcurve(path)
+    if lc is None:
+        raise _Missing(source_id)
     
-    flux = df.iloc[:, cols['ujy']].to_numpy(float)
-    flux_err = df.iloc[:, cols['dujy']].to_numpy(float)
-    filter_col = df.iloc[:, cols['filter']].to_numpy(str)
+    # Convert to barycentric Julian date
+    lc['time'] = bjd_convert(lc['time'], lc['ra'], lc['dec'], date_format='mjd')
 
-    return {"time": t_bjd, "flux": flux, "flux_err": flux_err,
-            "filter": filter_col, "ra": ra, "dec": dec}
+    _save_cached(path, lc)
+    return _freeze(lc)
 
-def read_bin_lightcurve(source_id, num_bins=500, num_cycles=3, normalization=False,
-                       period=None, reference_epoch=None):
+def read_lightcurve(source_id):
+    # Memoized per source; the returned arrays are shared and read-only.
+    # Missing sources are not memoized, so files added later are found.
+    try:
+        return _copy_dicts(_read_lightcurve_cached(source_id))
+    except _Missing:
+        return None
+
+@functools.lru_cache(maxsize=256)
+def _read_bin_lightcurve_cached(source_id, num_bins, num_cycles, normalization,
+                                period, reference_epoch, refine):
     from .timeseries import bin_phase_folded_data
-    from .bls import get_bls_stats
+    from .bls import get_bls_stats, refine_period
 
     lc_data = read_lightcurve(source_id)
     if lc_data is None:
-        return None
+        raise _Missing(source_id)
     
     bls_data = get_bls_stats(source_id)
     if bls_data is None and period is None:
-        return None
+        raise _Missing(source_id)
+    bls_per_min = None
     if bls_data is not None:
-        print(f'Period: {bls_data["per_min"]} min')
+        bls_per_min = bls_data['per_min']
         period=bls_data['per_day']
         reference_epoch=bls_data['epo']
+
+    # Optionally refine the period with a narrow Lomb-Scargle search (nifty-ls)
+    if refine:
+        period = refine_period(lc_data['time'], lc_data['flux'], lc_data['flux_err'], period,
+                               bands=lc_data['filter_code'])
     
-    c_mask = lc_data['filter'] == 'c'
-    o_mask = lc_data['filter'] == 'o'
+    c_idx = lc_data['c_idx']
+    o_idx = lc_data['o_idx']
     
     binned_c = bin_phase_folded_data(
-        time=lc_data['time'][c_mask],
-        flux=lc_data['flux'][c_mask],
-        flux_err=lc_data['flux_err'][c_mask],
+        time=lc_data['time'][c_idx],
+        flux=lc_data['flux'][c_idx],
+        flux_err=lc_data['flux_err'][c_idx],
         period=period,
         reference_epoch=reference_epoch,
         num_bins=num_bins,
@@ -77,9 +208,9 @@ def read_bin_lightcurve(source_id, num_bins=500, num_cycles=3, normalization=Fal
     )
     
     binned_o = bin_phase_folded_data(
-        time=lc_data['time'][o_mask],
-        flux=lc_data['flux'][o_mask],
-        flux_err=lc_data['flux_err'][o_mask],
+        time=lc_data['time'][o_idx],
+        flux=lc_data['flux'][o_idx],
+        flux_err=lc_data['flux_err'][o_idx],
         period=period,
         reference_epoch=reference_epoch,
         num_bins=num_bins,
@@ -87,4 +218,24 @@ def read_bin_lightcurve(source_id, num_bins=500, num_cycles=3, normalization=Fal
         normalization=normalization
     )
     
-    return {"c": binned_c, "o": binned_o}
\ No newline at end of file
+    return _freeze({"c": binned_c, "o": binned_o}), bls_per_min, period
+
+def read_bin_lightcurve(source_id, num_bins=500, num_cycles=3, normalization=False,
+                       period=None, reference_epoch=None, refine=False):
+    # Memoized on all arguments; the returned arrays are shared and read-only
+    try:
+        binned_lc, bls_per_min, period = _read_bin_lightcurve_cached(
+            source_id, num_bins, num_cycles, normalization, period, reference_epoch, refine)
+    except _Missing:
+        return None
+
+    if bls_per_min is not None:
+        print(f'Period: {bls_per_min} min')
+    if refine:
+        print(f'Refined period: {period * 1440} min')
+    return _copy_dicts(binned_lc)
+
+def clear_caches():
+    """Drop memoized lightcurves, e.g. after the files on disk have changed."""
+    _read_lightcurve_cached.cache_clear()
+    _read_bin_lightcurve_cached.cache_clear()
@@ -10,32 +10,29 @@ def p(*parts):
 def plots_path(*parts):
     return p("plots", *parts)
 
-def _get_hostname() -> str:
-    return socket.gethostname()
+# Resolved once at import: data_path/bls_path run once per source in loops
+_HOSTNAME = socket.gethostname()
+
+if _HOSTNAME == "hypernova":
+    _DATA_BASE = Path("/data2/ATLAS/WDs/")
+    _BLS_BASE = Path("/data/Bulk_BLS_ATLAS/")
+elif _HOSTNAME.startswith("node"):
+    _DATA_BASE = Path("/orcd/data/kburdge/001/ATLAS/ATLAS_Lightcurves/")  
+    _BLS_BASE = Path("/orcd/data/kburdge/001/ATLAS/ATLAS_BLS/")
+else:
+    _DATA_BASE = _BLS_BASE = None
 
 def data_path(*parts):
-    hostname = _get_hostname()
+    if _DATA_BASE is None:
+        raise RuntimeError(f"hostname '{_HOSTNAME}' not recognized")
 
-    if hostname == "hypernova":
-        base = Path("/data2/ATLAS/WDs/")
-    elif hostname.startswith("node"):
-        base = Path("/orcd/data/kburdge/001/ATLAS/ATLAS_Lightcurves/")  
-    else:
-        raise RuntimeError(f"hostname '{hostname}' not recognized")
-
-    return base.joinpath(*parts)
+    return _DATA_BASE.joinpath(*parts)
 
 def bls_path(*parts):
-    hostname = _get_hostname()
-
-    if hostname == "hypernova":
-        base = Path("/data/Bulk_BLS_ATLAS/")
-    elif hostname.startswith("node"):
-        base = Path("/orcd/data/kburdge/001/ATLAS/ATLAS_BLS/")
-    else:
-        raise RuntimeError(f"hostname '{hostname}' not recognized")
+    if _BLS_BASE is None:
+        raise RuntimeError(f"hostname '{_HOSTNAME}' not recognized")
 
-    return base.joinpath(*parts)
+    return _BLS_BASE.joinpath(*parts)
 
 def lc_path(source_id):
     return data_path(str(source_id))
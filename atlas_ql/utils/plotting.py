@@ -10,6 +10,17 @@ import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.rcParams['font.family'] = 'DejaVu Sans'
 
+# ATLAS filters and their plot colors, in legend order
+FILTER_COLORS = (('c', 'cyan'), ('o', 'orange'))
+
+def _filter_idx(lc_data, filt):
+    # Precomputed by read_lightcurve; other lightcurve dicts use their filter column
+    idx = lc_data.get(f'{filt}_idx')
+    if idx is None:
+        import numpy as np
+        idx = np.flatnonzero(np.asarray(lc_data['filter']) == filt)
+    return idx
+
 def plot_lightcurve(lc_data, source_id=None, figsize=(10, 4), dpi=120, 
                     alpha=0.7, marker_size=2.5):
 
@@ -17,17 +28,17 @@ def plot_lightcurve(lc_data, source_id=None, figsize=(10, 4), dpi=120,
     times = lc_data['time']
     flux = lc_data['flux']
     flux_err = lc_data['flux_err']
-    filters = lc_data['filter']
     
     # Plot by filter
     fig, ax = plt.subplots(figsize=figsize)
-    colors = {'o': 'orange', 'c': 'cyan'}
     
-    for filt in sorted(set(filters)):
-        mask = filters == filt
-        ax.errorbar(times[mask], flux[mask], flux_err[mask], 
+    for filt, color in FILTER_COLORS:
+        idx = _filter_idx(lc_data, filt)
+        if idx.size == 0:
+            continue
+        ax.errorbar(times[idx], flux[idx], flux_err[idx], 
                    fmt='.', ms=marker_size, alpha=alpha, capsize=3,
-                   label=f"Filter {filt}", color=colors.get(filt, 'gray'))
+                   label=f"Filter {filt}", color=color)
     
     ax.set_xlabel('Time (MJD)')
     ax.set_ylabel('Flux (µJy)')
@@ -77,49 +88,41 @@ def plot_binned_phase_folded(binned_lc, source_id=None, figsize=(10, 4),
 def plot_phase_folded(lc_data, period, reference_epoch=None, period_derivative=0,
                       source_id=None, figsize=(10, 4), dpi=120, 
                       alpha=0.5, marker_size=1.5, num_cycles=3):
-    from .timeseries import phase_fold
+    from .timeseries import phase_fold, cycle_offsets
     import numpy as np
     
     # Extract data
     times = lc_data['time']
     flux = lc_data['flux']
     flux_err = lc_data['flux_err']
-    filters = lc_data['filter']
     
     # Phase fold the data
     phases = phase_fold(times, period, period_derivative, reference_epoch)
+    offsets = cycle_offsets(num_cycles)
     
     # Create figure
     fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
     
-    colors = {'c': 'cyan', 'o': 'orange'}
-    
     # Plot each filter
-    for filt in sorted(set(filters)):
-        mask = filters == filt
-        phase_filt = phases[mask]
-        flux_filt = flux[mask]
-        flux_err_filt = flux_err[mask]
+    for filt, color in FILTER_COLORS:
+        idx = _filter_idx(lc_data, filt)
+        if idx.size == 0:
+            continue
+        phase_filt = phases[idx]
+        flux_filt = flux[idx]
+        flux_err_filt = flux_err[idx]
         
-        # Replicate for multiple cycles
-        if num_cycles == 1:
-            phase_plot = phase_filt
-            flux_plot = flux_filt
-            flux_err_plot = flux_err_filt
-        elif num_cycles == 2:
-            phase_plot = np.concatenate([phase_filt - 1, phase_filt])
-            flux_plot = np.concatenate([flux_filt, flux_filt])
-            flux_err_plot = np.concatenate([flux_err_filt, flux_err_filt])
-        elif num_cycles == 3:
-            phase_plot = np.concatenate([phase_filt - 1, phase_filt, phase_filt + 1])
-            flux_plot = np.concatenate([flux_filt, flux_filt, flux_filt])
-            flux_err_plot = np.concatenate([flux_err_filt, flux_err_filt, flux_err_filt])
-        else:
-            raise ValueError(f"num_cycles must be 1, 2, or 3, got {num_cycles}")
+        # Replicate for multiple cycles, each shifted copy written in place
+        n = len(phase_filt)
+        phase_plot = np.empty(num_cycles * n)
+        for i, offset in enumerate(offsets):
+            np.add(phase_filt, offset, out=phase_plot[i * n:(i + 1) * n])
+        flux_plot = np.tile(flux_filt, num_cycles)
+        flux_err_plot = np.tile(flux_err_filt, num_cycles)
         
         ax.errorbar(phase_plot, flux_plot, flux_err_plot,
                    fmt='.', ms=marker_size, alpha=alpha, capsize=0,
-                   color=colors.get(filt, 'gray'), label=f'{filt}-band')
+                   color=color, label=f'{filt}-band')
     
     ax.set_xlabel('Phase', fontsize=12)
     ax.set_ylabel('Flux (µJy)', fontsize=12)
@@ -201,6 +204,8 @@ def plot_scatter(catalog, x_col, y_col, color_col=None,
 def plot_multi_lightcurves(catalog, gid_col='gid', n_per_row=3,
                            num_bins=200, markersize=2):
     from .io import read_bin_lightcurve 
+    from concurrent.futures import ThreadPoolExecutor
+    import os
     
     # Get GIDs
     if catalog.index.name == gid_col:
@@ -223,38 +228,39 @@ def plot_multi_lightcurves(catalog, gid_col='gid', n_per_row=3,
         axes = axes.reshape(1, -1)
     
     axes_flat = axes.flatten()
+    gids = gids[:len(axes_flat)]
     
-    for idx, gid in enumerate(gids):
-        if idx >= len(axes_flat):
-            break
-            
-        ax = axes_flat[idx]
-        row = rows.loc[gid]
-        
-        binned_lc = read_bin_lightcurve(gid, num_bins=num_bins)
-        
+    # Read and bin all sources in parallel; plotting stays on this thread
+    max_workers = max(1, min(len(gids), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = [ex.submit(read_bin_lightcurve, gid, num_bins=num_bins)
+                   for gid in gids]
+
+        for ax, gid, future in zip(axes_flat, gids, futures):
+            row = rows.loc[gid]
+            binned_lc = future.result()
 
-        ax.errorbar(binned_lc['c']['phase'], 
-                   binned_lc['c']['flux'],
-                   binned_lc['c']['flux_err'], 
-                   fmt='.', ms=marker_size,
-                   alpha=0.5, color='cyan', label='c')
+            ax.errorbar(binned_lc['c']['phase'], 
+                       binned_lc['c']['flux'],
+                       binned_lc['c']['flux_err'], 
+                       fmt='.', ms=markersize,
+                       alpha=0.5, color='cyan', label='c')
+                
+            ax.errorbar(binned_lc['o']['phase'], 
+                       binned_lc['o']['flux'],
+                       binned_lc['o']['flux_err'], 
+                       fmt='.', ms=markersize,
+                       alpha=0.5, color='orange', label='o')
             
-        ax.errorbar(binned_lc['o']['phase'], 
-                   binned_lc['o']['flux'],
-                   binned_lc['o']['flux_err'], 
-                   fmt='.', ms=marker_size,
-                   alpha=0.5, color='orange', label='o')
-        
-        ax.set_xlim(-1, 2)
-        
-        # Title with key parameters
-        period_str = f"{row['per_min']:.1f}m" if 'per_min' in row else f"{row.get('per_day', 0):.4f}d"
-        ax.set_title(f"P={period_str}, SNR={row['snr']:.1f}", fontsize=9)
-        ax.set_xlabel('Phase', fontsize=8)
-        ax.set_ylabel('Flux (µJy)', fontsize=8)
-        ax.tick_params(labelsize=7)
-        ax.legend(fontsize=6, loc='best')
+            ax.set_xlim(-1, 2)
+            
+            # Title with key parameters
+            period_str = f"{row['per_min']:.1f}m" if 'per_min' in row else f"{row.get('per_day', 0):.4f}d"
+            ax.set_title(f"P={period_str}, SNR={row['snr']:.1f}", fontsize=9)
+            ax.set_xlabel('Phase', fontsize=8)
+            ax.set_ylabel('Flux (µJy)', fontsize=8)
+            ax.tick_params(labelsize=7)
+            ax.legend(fontsize=6, loc='best')
     
     # Hide unused axes
     for idx in range(n_candidates, len(axes_flat)):
@@ -1,9 +1,18 @@
+import functools
 import numpy as np
+from astropy.time import Time
+from astropy.coordinates import EarthLocation, SkyCoord
 
-def bjd_convert(time, ra, dec, date_format='mjd', telescope='Palomar', scale='tcb'):
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+@functools.lru_cache(maxsize=8)
+def _site_location(telescope):
+    return EarthLocation.of_site(telescope)
 
-    from astropy.time import Time
-    from astropy.coordinates import EarthLocation, SkyCoord
+def bjd_convert(time, ra, dec, date_format='mjd', telescope='Palomar', scale='tcb'):
 
     # Create sky coordinate
     coord = SkyCoord(ra, dec, unit="deg")
@@ -15,7 +24,7 @@ def bjd_convert(time, ra, dec, date_format='mjd', telescope='Palomar', scale='tc
     time_scaled = time_obj.tcb if scale == 'tcb' else time_obj.tdb
 
     # Get observatory location
-    observatory = EarthLocation.of_site(telescope)
+    observatory = _site_location(telescope)
 
     # Calculate light travel time correction for barycentric motion
     correction = time_scaled.light_travel_time(coord, kind='barycentric', location=observatory)
@@ -63,6 +72,72 @@ def phase_fold(time, period, period_derivative=0, reference_epoch=None):
     
     return phases
 
+def cycle_offsets(num_cycles):
+    """
+    Phase offsets of the cycles replicated for display.
+
+    Parameters
+    ----------
+    num_cycles : int
+        Number of cycles to replicate: 1, 2, or 3
+
+    Returns
+    -------
+    offsets : ndarray
+        [0], [-1, 0] or [-1, 0, 1]
+    """
+    if num_cycles not in (1, 2, 3):
+        raise ValueError(f"num_cycles must be 1, 2, or 3, got {num_cycles}")
+    return np.arange(num_cycles) - (num_cycles > 1)
+
+def _fold_and_bin(time, flux, flux_err, period, period_derivative, reference_epoch, num_bins):
+    """Phase fold and return per-bin sums of weights and weighted flux."""
+    phases = phase_fold(time, period, period_derivative, reference_epoch)
+
+    # Filter out invalid errors (zero, negative, or NaN)
+    valid = (flux_err > 0) & np.isfinite(flux_err) & np.isfinite(flux) & np.isfinite(phases)
+    phases = phases[valid]
+    flux = flux[valid]
+    flux_err = flux_err[valid]
+
+    # Assign each point to its phase bin
+    bin_idx = np.minimum((phases * num_bins).astype(np.intp), num_bins - 1)
+
+    weights = 1.0 / (flux_err**2)
+    sum_w = np.bincount(bin_idx, weights=weights, minlength=num_bins)
+    sum_wf = np.bincount(bin_idx, weights=flux * weights, minlength=num_bins)
+
+    return sum_w, sum_wf
+
+def _fold_and_bin_loop(time, flux, flux_err, period, period_derivative, reference_epoch, num_bins):
+    # Same as _fold_and_bin in a single pass, without temporaries; for numba
+    sum_w = np.zeros(num_bins)
+    sum_wf = np.zeros(num_bins)
+
+    for i in range(time.size):
+        f = flux[i]
+        err = flux_err[i]
+        if not (err > 0 and np.isfinite(err) and np.isfinite(f)):
+            continue
+
+        dt = time[i] - reference_epoch
+        phase = ((dt - 0.5 * period_derivative / period * dt * dt) % period) / period
+        if not np.isfinite(phase):
+            continue
+
+        ibin = min(int(phase * num_bins), num_bins - 1)
+        w = 1.0 / (err * err)
+        sum_w[ibin] += w
+        sum_wf[ibin] += w * f
+
+    return sum_w, sum_wf
+
+# fastmath without 'nnan'/'ninf', which would drop the finiteness checks
+_fold_and_bin_numba = None
+if njit is not None:
+    _fold_and_bin_numba = njit(fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'},
+                               cache=True)(_fold_and_bin_loop)
+
 def bin_phase_folded_data(time, flux, flux_err, period, period_derivative=0, 
                           reference_epoch=None, num_bins=500, num_cycles=3, normalization=False):
     """
@@ -98,55 +173,41 @@ def bin_phase_folded_data(time, flux, flux_err, period, period_derivative=0,
     -----
     Uses inverse-variance weighting for bin averages. Empty bins are filled with NaN.
     """
-    # Phase fold the data
-    phases = phase_fold(time, period, period_derivative, reference_epoch)
+    time = np.ascontiguousarray(time, dtype=np.float64)
+    flux = np.ascontiguousarray(flux, dtype=np.float64)
+    flux_err = np.ascontiguousarray(flux_err, dtype=np.float64)
+
+    if reference_epoch is None:
+        reference_epoch = np.min(time)
 
     # Create phase bins
     bin_edges = np.linspace(0, 1, num_bins + 1)
     bin_centers = 0.5 * (bin_edges[:-1] + bin_edges[1:])
 
-    binned_lc = []
-    
-    for i, phase_center in enumerate(bin_centers):
-        # Find data points in this phase bin
-        phase_min = bin_edges[i]
-        phase_max = bin_edges[i + 1]
-        
-        mask = (phases >= phase_min) & (phases < phase_max)
-        
-        if not np.any(mask):
-            # Empty bin - use NaN values
-            binned_lc.append([phase_center, np.nan, np.nan])
-            continue
-            
-        # Inverse-variance weighted average
-        bin_flux = flux[mask]
-        bin_flux_err = flux_err[mask]
-        
-        # Filter out invalid errors (zero, negative, or NaN)
-        valid = (bin_flux_err > 0) & np.isfinite(bin_flux_err) & np.isfinite(bin_flux)
-        
-        if not np.any(valid):
-            # No valid data in this bin
-            binned_lc.append([phase_center, np.nan, np.nan])
-            continue
-        
-        bin_flux = bin_flux[valid]
-        bin_flux_err = bin_flux_err[valid]
-        
-        weights = 1.0 / (bin_flux_err**2)
-        
-        weighted_mean = np.sum(bin_flux * weights) / np.sum(weights)
-        weighted_error = np.sqrt(1.0 / np.sum(weights))
-        
-        binned_lc.append([phase_center, weighted_mean, weighted_error])
-    
-    binned_lc = np.array(binned_lc)
+    # Inverse-variance weighted sums per bin
+    fold_and_bin = _fold_and_bin_numba if _fold_and_bin_numba is not None else _fold_and_bin
+    sum_w, sum_wf = fold_and_bin(time, flux, flux_err, period, period_derivative,
+                                 reference_epoch, num_bins)
+
+    # One contiguous array per quantity, holding every replicated cycle;
+    # the unshifted cycle is filled in place and copied to the others
+    offsets = cycle_offsets(num_cycles)
+    binned_phase = np.empty(num_cycles * num_bins)
+    binned_flux = np.full(num_cycles * num_bins, np.nan)
+    binned_flux_err = np.full(num_cycles * num_bins, np.nan)
+
+    center = (num_cycles // 2) * num_bins
+    core = slice(center, center + num_bins)
+    binned_phase[core] = bin_centers
+
+    # Empty bins (or bins with no valid data) stay NaN
+    filled = sum_w > 0
+    bin_flux = sum_wf[filled] / sum_w[filled]
+    bin_flux_err = np.sqrt(1.0 / sum_w[filled])
 
     # Apply normalization if requested
     if normalization:
-        valid_flux = binned_lc[:, 1][np.isfinite(binned_lc[:, 1])]
-        if len(valid_flux) == 0:
+        if len(bin_flux) == 0:
             raise ValueError("No valid flux values for normalization")
             
         norm_methods = {
@@ -161,29 +222,26 @@ def bin_phase_folded_data(time, flux, flux_err, period, period_derivative=0,
             raise ValueError(f"Unknown normalization method: {normalization}. "
                            f"Choose from {list(norm_methods.keys())}")
             
-        norm_factor = norm_methods[norm_method](valid_flux)
-        binned_lc[:, 1] /= norm_factor
-        binned_lc[:, 2] /= norm_factor
+        norm_factor = norm_methods[norm_method](bin_flux)
+        inv_norm = 1.0 / norm_factor
+        bin_flux *= inv_norm
+        bin_flux_err *= inv_norm
+
+    binned_flux[core][filled] = bin_flux
+    binned_flux_err[core][filled] = bin_flux_err
         
     # Replicate cycles for display
-    if num_cycles == 1:
-        pass  # Keep as is
-    elif num_cycles == 2:
-        cycle_prev = binned_lc.copy()
-        cycle_prev[:, 0] -= 1.0
-        binned_lc = np.vstack([cycle_prev, binned_lc])
-    elif num_cycles == 3:
-        cycle_prev = binned_lc.copy()
-        cycle_prev[:, 0] -= 1.0
-        cycle_next = binned_lc.copy()
-        cycle_next[:, 0] += 1.0
-        binned_lc = np.vstack([cycle_prev, binned_lc, cycle_next])
-    else:
-        raise ValueError(f"num_cycles must be 1, 2, or 3, got {num_cycles}")
+    for i, offset in enumerate(offsets):
+        block = slice(i * num_bins, (i + 1) * num_bins)
+        if block == core:
+            continue
+        np.add(bin_centers, offset, out=binned_phase[block])
+        np.copyto(binned_flux[block], binned_flux[core])
+        np.copyto(binned_flux_err[block], binned_flux_err[core])
     
     # Return as dictionary
     return {
-        'phase': binned_lc[:, 0],
-        'flux': binned_lc[:, 1],
-        'flux_err': binned_lc[:, 2]
+        'phase': binned_phase,
+        'flux': binned_flux,
+        'flux_err': binned_flux_err
     }
@@ -5,12 +5,13 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     install_requires=[
-        "numpy",
+        "numpy>=1.23",
         "pandas",
         "matplotlib",
         "astropy",
     ],
     extras_require={
+        "fast": ["pyarrow", "numba", "nifty-ls"],
         "dev": ["jupyter", "ipython"],
     },
 )